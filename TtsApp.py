@@ -1,13 +1,18 @@
+# Heavy libraries (onnxruntime, kokoro_onnx, soundfile, sounddevice) are imported
+# at first use so the window appears without paying their import cost up front.
 import numpy as np
-from kokoro_onnx import Kokoro # Assuming kokoro_onnx is installed and accessible
+import asyncio
+import json
 import logging
+import threading
 import os
 import ensure_models as downloadUtils
 import constants
-import soundfile as sf # For saving audio to a file
-import sounddevice as sd # For playing audio
 import tkinter as tk
 from tkinter import scrolledtext, messagebox, filedialog, ttk # Import ttk for themed widgets
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import blake2b
 from local_config import load_config, save_config, DEFAULT_SPEAKER_KEY, DEFAULT_LANGUAGE_DISPLAY
 
 logger = downloadUtils.logger
@@ -15,70 +20,276 @@ logger = downloadUtils.logger
 # --- Main Program Logic ---
 # A wrapper class to manage Kokoro model loading and text-to-speech generation
 class KokoroTTS:
+    _PHONEME_CACHE_SIZE = 32
+
     def __init__(self):
         self.kokoro_instance = None
+        self._voice_cache = {} # speaker name -> style embedding, filled on first use
+        self._voice_index = None # name -> offset/shape into the flat voice bank
+        self._voice_bank = None # memmap over the bank, shared by all voices
+        self._phoneme_cache = OrderedDict() # (text digest, lang) -> phonemes, LRU-bounded
+        self._warmed = threading.Event()
         self._load_kokoro_model()
 
+    @staticmethod
+    def _make_session_options():
+        import onnxruntime
+
+        # Tuned ORT session: full graph fusions, a dedicated intra-op thread pool
+        # and arena/mem-pattern reuse, instead of the library defaults.
+        sess_options = onnxruntime.SessionOptions()
+        sess_options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        sess_options.intra_op_num_threads = max(1, (os.cpu_count() or 1) - 1)
+        sess_options.inter_op_num_threads = 1 # Sequential graph; no parallel subgraphs
+        sess_options.execution_mode = onnxruntime.ExecutionMode.ORT_SEQUENTIAL
+        sess_options.enable_cpu_mem_arena = True
+        sess_options.enable_mem_pattern = True
+        return sess_options
+
     def _load_kokoro_model(self):
+        import onnxruntime
+        from kokoro_onnx import Kokoro
+
         downloadUtils.ensure_kokoro_assets_exist()
         try:
-            self.kokoro_instance = Kokoro(
-                model_path=constants.MODEL_PATH, 
+            # Prefer CUDA when the installed onnxruntime build exposes it
+            available = onnxruntime.get_available_providers()
+            providers = [p for p in ("CUDAExecutionProvider", "CPUExecutionProvider") if p in available]
+            # The session must be built from the model *path*: Kokoro.from_session
+            # validates session._model_path, which is None for a bytes-constructed
+            # session, so the mmap/bytes loading trick breaks this library version.
+            session = onnxruntime.InferenceSession(
+                downloadUtils.active_model_path(),
+                sess_options=self._make_session_options(),
+                providers=providers,
+            )
+            self.kokoro_instance = Kokoro.from_session(
+                session=session,
                 voices_path=constants.VOICES_PATH
             )
             print("Kokoro model initialized.")
         except Exception as e:
             logger.error(f"ERROR: Could not load kokoro-onnx: {e}")
             raise
+        # Warm up the ONNX session off the interactive path so the first click
+        # doesn't pay for graph optimization and thread-pool spin-up.
+        threading.Thread(target=self._warmup, daemon=True).start()
 
-    def get_speaker_data(self, speaker_name: str) -> dict:
-        if self.kokoro_instance is None:
-            self._load_kokoro_model()
-        # Get Kokoro speaker style
-        speaker_data: np.ndarray = self.kokoro_instance.get_voice_style(speaker_name)
-        return {"speaker": speaker_data}
-
-    def generate_audio(self, text: str, speaker_data: dict, speed: float = 1.0, lang_display: str = "English") -> tuple:
-        if self.kokoro_instance is None:
-            self._load_kokoro_model()
+    def _warmup(self):
+        try:
+            voice = self.get_speaker_data(DEFAULT_SPEAKER_KEY)
+            self.kokoro_instance.create("a", voice=voice, speed=1.0, lang="en-us")
+        except Exception as e:
+            logger.warning(f"Kokoro warmup failed: {e}")
+        finally:
+            self._warmed.set()
+
+    @property
+    def warmed(self) -> bool:
+        return self._warmed.is_set()
+
+    def _load_voice_style(self, speaker_name: str) -> np.ndarray:
+        # Prefer the flat voice bank written by ensure_models: one memmap shared by
+        # every voice, with an O(1) offset lookup instead of zip-entry seeks. Fall
+        # back to Kokoro's own loader for legacy .npz voice archives.
+        if os.path.exists(constants.VOICES_INDEX_PATH):
+            if self._voice_index is None:
+                with open(constants.VOICES_INDEX_PATH) as f:
+                    self._voice_index = json.load(f)
+                self._voice_bank = np.load(constants.VOICES_PATH, mmap_mode='r')
+            entry = self._voice_index.get(speaker_name)
+            if entry is not None:
+                offset = entry["offset"]
+                shape = tuple(entry["shape"])
+                size = int(np.prod(shape))
+                return self._voice_bank[offset:offset + size].reshape(shape)
+        return self.kokoro_instance.get_voice_style(speaker_name)
+
+    def get_speaker_data(self, speaker_name: str) -> np.ndarray:
+        # Returns the raw style array; __init__ always loads the model (and raises
+        # on failure), so no re-entrancy guard is needed here or below.
+        if speaker_name not in constants.SUPPORTED_VOICES_SET:
+            raise ValueError(f"Unknown speaker '{speaker_name}'.")
+        # Get Kokoro speaker style; embeddings are immutable, so cache them per name
+        # instead of re-fetching from the voices archive on every click.
+        speaker_data = self._voice_cache.get(speaker_name)
+        if speaker_data is None:
+            # Materialize as contiguous float32 once, so every inference hands ORT
+            # the same ready-to-bind buffer with no per-call conversion or copy.
+            speaker_data = np.ascontiguousarray(self._load_voice_style(speaker_name), dtype=np.float32)
+            self._voice_cache[speaker_name] = speaker_data
+        return speaker_data
+
+    def _phonemes_for(self, text: str, lang_code: str) -> str:
+        # Phonemization depends only on (text, lang) — not voice or speed — so
+        # regenerating the same text with different settings skips G2P entirely.
+        key = (blake2b(text.encode()).digest(), lang_code)
+        phonemes = self._phoneme_cache.get(key)
+        if phonemes is None:
+            phonemes = self.kokoro_instance.tokenizer.phonemize(text, lang=lang_code)
+            self._phoneme_cache[key] = phonemes
+            if len(self._phoneme_cache) > self._PHONEME_CACHE_SIZE:
+                self._phoneme_cache.popitem(last=False)
+        else:
+            self._phoneme_cache.move_to_end(key)
+        return phonemes
 
-        lang_code = constants.SUPPORTED_LANGUAGES.get(lang_display, "en-us") # Default to en-us if not found
+    def generate_audio(self, text: str, voice: np.ndarray, name: str = "unknown", speed: float = 1.0, lang_code: str = "en-us") -> tuple:
+        self._warmed.wait(timeout=10) # Don't overlap a real request with the warmup run
 
         try:
-            print(f"Generating audio for text: '{text[:50]}...' with speaker '{speaker_data.get('name', 'unknown')}' and language '{lang_display}'...")
-            audio_array, sample_rate = self.kokoro_instance.create(text, voice=speaker_data["speaker"], speed=speed, lang=lang_code)
+            print(f"Generating audio for text: '{text[:50]}...' with speaker '{name}' and language '{lang_code}'...")
+            try:
+                phonemes = self._phonemes_for(text, lang_code)
+                audio_array, sample_rate = self.kokoro_instance.create(
+                    phonemes, voice=voice, speed=speed, lang=lang_code, is_phonemes=True
+                )
+            except (AttributeError, TypeError):
+                # Older kokoro_onnx without a public tokenizer/is_phonemes path
+                audio_array, sample_rate = self.kokoro_instance.create(text, voice=voice, speed=speed, lang=lang_code)
             print("Audio generation complete.")
             if audio_array is None:
                 raise ValueError("Kokoro returned no audio.")
+            # One guaranteed contiguous float32 copy here, so sounddevice and
+            # soundfile don't each convert implicitly downstream.
+            audio_array = np.ascontiguousarray(audio_array, dtype=np.float32)
             return audio_array, sample_rate
         except Exception as e:
             logger.error(f"Error during audio generation: {e}")
             raise
 
+    def generate_audio_batch(self, texts: list, voice: np.ndarray, name: str = "unknown", speed: float = 1.0, lang_code: str = "en-us") -> tuple:
+        # Synthesize several texts in one call, e.g. the sentences of a long
+        # document. Entries are processed shortest-first so similarly sized inputs
+        # run back to back, and per-entry audio is returned in the original order.
+        # kokoro_onnx's public API has no dynamic-batch token path, so entries run
+        # serially; the phoneme cache still amortizes repeated entries. This is
+        # also the aggregation point for any future concurrent callers (e.g. an
+        # API front end): queue requests here rather than adding a batching
+        # framework around the single-sequence ONNX graph.
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        results = [None] * len(texts)
+        sample_rate = None
+        for i in order:
+            results[i], sample_rate = self.generate_audio(texts[i], voice, name, speed, lang_code)
+        return results, sample_rate
+
+    def generate_audio_stream(self, text: str, voice: np.ndarray, name: str = "unknown", speed: float = 1.0, lang_code: str = "en-us", on_chunk=None, stop_event=None) -> tuple:
+        # Synthesize sentence-by-sentence via Kokoro's async generator, invoking
+        # on_chunk(samples, sample_rate) as each chunk becomes available. Returns the
+        # concatenated (audio_array, sample_rate) once the whole text is done, so
+        # playback can start after the first sentence instead of the last.
+        self._warmed.wait(timeout=10) # Don't overlap a real request with the warmup run
+
+        async def _stream(content, **create_kwargs):
+            chunks = []
+            sample_rate = None
+            async for samples, sr in self.kokoro_instance.create_stream(
+                content, voice=voice, speed=speed, lang=lang_code, **create_kwargs
+            ):
+                if stop_event is not None and stop_event.is_set():
+                    break # Cancel the remaining sentences
+                sample_rate = sr
+                if on_chunk is not None:
+                    on_chunk(samples, sr)
+                chunks.append(samples)
+            if not chunks:
+                if stop_event is not None and stop_event.is_set():
+                    return None, None # Stopped before the first chunk arrived
+                raise ValueError("Kokoro returned no audio.")
+            # Contiguous float32 so replay and save reuse the array without conversion
+            return np.concatenate(chunks).astype(np.float32, copy=False), sample_rate
+
+        try:
+            print(f"Streaming audio for text: '{text[:50]}...' with speaker '{name}' and language '{lang_code}'...")
+            try:
+                # Same phoneme cache as the non-streaming path, so regenerating
+                # identical text skips G2P here too
+                phonemes = self._phonemes_for(text, lang_code)
+                audio_array, sample_rate = asyncio.run(_stream(phonemes, is_phonemes=True))
+            except (AttributeError, TypeError):
+                # Older kokoro_onnx without a public tokenizer/is_phonemes path
+                audio_array, sample_rate = asyncio.run(_stream(text))
+            print("Audio generation complete.")
+            return audio_array, sample_rate
+        except Exception as e:
+            logger.error(f"Error during streaming audio generation: {e}")
+            raise
+
+# Replay goes through a persistent OutputStream fed in fixed-size blocks, so no
+# full-array copy into PortAudio's buffer and the stream survives across replays.
+# Only one writer thread may feed the stream at a time.
+_PLAYBACK_BLOCKSIZE = 4096
+_playback_stream = None
+_playback_thread = None
+_playback_stop = threading.Event()
+
+def _interrupt_playback_writer():
+    # Interrupt and join any replay writer still running, so the caller can
+    # safely clear the stop event and start its own playback without two
+    # sources interleaving audio.
+    global _playback_thread
+    if _playback_thread is not None and _playback_thread.is_alive():
+        _playback_stop.set()
+        if _playback_stream is not None:
+            _playback_stream.abort()
+        _playback_thread.join()
+    _playback_thread = None
+
 def play_audio(audio_array: np.ndarray, sample_rate: int):
-    try:
-        print("Playing audio...")
-        sd.play(audio_array, samplerate=sample_rate)
-    except Exception as e:
-        print(f"Error playing audio: {e}")
+    import sounddevice as sd
+    global _playback_thread
+
+    def _writer():
+        global _playback_stream
+        try:
+            if _playback_stream is None or _playback_stream.samplerate != sample_rate:
+                if _playback_stream is not None:
+                    _playback_stream.close()
+                _playback_stream = sd.OutputStream(
+                    samplerate=sample_rate, channels=1, dtype='float32', blocksize=_PLAYBACK_BLOCKSIZE
+                )
+                _playback_stream.start()
+            elif _playback_stream.stopped:
+                _playback_stream.start() # Reused stream was aborted by a previous stop
+            for i in range(0, len(audio_array), _PLAYBACK_BLOCKSIZE):
+                if _playback_stop.is_set():
+                    break
+                _playback_stream.write(audio_array[i:i + _PLAYBACK_BLOCKSIZE])
+        except Exception as e:
+            if _playback_stop.is_set():
+                return # Stop aborted the stream mid-write; expected, not an error
+            print(f"Error playing audio: {e}")
+
+    print("Playing audio...")
+    _interrupt_playback_writer()
+    _playback_stop.clear()
+    _playback_thread = threading.Thread(target=_writer, daemon=True)
+    _playback_thread.start()
 
 def stop_audio():
+    global _playback_stream
     try:
-        sd.stop()
+        _playback_stop.set()
+        if _playback_stream is not None:
+            _playback_stream.abort()
+            _playback_stream.close()
+            _playback_stream = None
         print("Audio playback stopped.")
     except Exception as e:
         print(f"Error stopping audio: {e}")
 
-def save_audio_to_wav(audio_array: np.ndarray, sample_rate: int):
+def save_audio_to_wav(audio_array: np.ndarray, sample_rate: int, file_path: str):
+    import soundfile as sf
+
     try:
-        file_path = filedialog.asksaveasfilename(
-            title="Save Audio As",
-            defaultextension=".wav", 
-            filetypes=[("WAV files", "*.wav")]
-        )
-        sf.write(file_path, audio_array, sample_rate)
+        # 16-bit PCM halves the file size vs float32; soundfile converts the
+        # [-1, 1] float samples directly.
+        sf.write(file_path, audio_array, sample_rate, subtype="PCM_16")
+        print(f"Audio saved to '{file_path}'")
     except Exception as e:
         print(f"Error saving audio to WAV: {e}")
+        raise
 
 # --- GUI Application ---
 class TTSApp:
@@ -102,11 +313,17 @@ class TTSApp:
         self.last_sample_rate = None
         self.last_output_filename = None # Store the filename for FFmpeg comments
 
+        # Single worker thread for TTS inference so the Tk event loop stays responsive
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._cached_text = None # Last stripped text, reused while the widget is unmodified
+
         # Load persistent configuration
         self.config = load_config()
         self.initial_speed = self.config.get('speed', 1.0) # Default to 1.0 if not found
         self.initial_language = self.config.get('language', DEFAULT_LANGUAGE_DISPLAY)
         self.initial_speaker = self.config.get('speaker', DEFAULT_SPEAKER_KEY)
+        # Language code is resolved when the dropdown changes, not per generation
+        self._lang_code = constants.SUPPORTED_LANGUAGES.get(self.initial_language, "en-us")
 
         self.selected_language = tk.StringVar(master)
         self.selected_language.set(self.initial_language) # Set default language
@@ -136,6 +353,7 @@ class TTSApp:
         self.text_input = scrolledtext.ScrolledText(text_frame, wrap=tk.WORD, width=60, height=10, font=("Arial", 10))
         self.text_input.pack(fill="both", expand=True)
         self.text_input.insert(tk.END, "Hello, this is a test of the Kokoro text-to-speech system.")
+        self.text_input.edit_modified(False) # Reset so the first read caches cleanly
 
         # Settings Frame
         settings_frame = ttk.Labelframe(self.master, text="Settings", padding=10)
@@ -157,6 +375,10 @@ class TTSApp:
         self.language_dropdown.set(self.initial_language)
         self.speaker_dropdown.set(self.initial_speaker)
 
+        # Persist settings when the user explicitly changes a dropdown
+        self.language_dropdown.bind("<<ComboboxSelected>>", self._on_setting_changed)
+        self.speaker_dropdown.bind("<<ComboboxSelected>>", self._on_setting_changed)
+
         # Speed Input
         speed_label = ttk.Label(settings_frame, text="Speech Speed (0.1 - 4.0):")
         speed_label.grid(row=2, column=0, padx=5, pady=5, sticky="w")
@@ -180,8 +402,30 @@ class TTSApp:
         self.stop_button = ttk.Button(button_frame, text="Stop", command=self.stop_button_clicked, state=tk.ACTIVE)
         self.stop_button.pack(side=tk.LEFT, padx=5)
 
+        self._gate_on_warmup()
+
+    def _gate_on_warmup(self):
+        # Keep Generate disabled until the warmup inference has finished, so the
+        # first real click never queues behind it.
+        if self.kokoro_tts.warmed:
+            self.generate_button.config(state=tk.NORMAL, text="Generate & Play Audio")
+        else:
+            self.generate_button.config(state=tk.DISABLED, text="Warming up...")
+            self.master.after(100, self._gate_on_warmup)
+
+    def _on_setting_changed(self, event=None):
+        self.config['language'] = self.selected_language.get()
+        self.config['speaker'] = self.selected_speaker.get()
+        self._lang_code = constants.SUPPORTED_LANGUAGES.get(self.selected_language.get(), "en-us")
+        save_config(self.config)
+
     def generate_button_clicked(self):
-        input_text = self.text_input.get("1.0", tk.END).strip()
+        # Only pull the text buffer through Tcl when it actually changed; the
+        # common regenerate-with-new-speed/voice flow reuses the cached copy.
+        if self._cached_text is None or self.text_input.edit_modified():
+            self._cached_text = self.text_input.get("1.0", tk.END).strip()
+            self.text_input.edit_modified(False)
+        input_text = self._cached_text
         if not input_text:
             messagebox.showwarning("Input Error", "Please enter some text to synthesize.")
             return
@@ -198,41 +442,89 @@ class TTSApp:
         selected_lang_display = self.selected_language.get()
         selected_speaker_key = self.selected_speaker.get()
 
-        # Save current settings to config
+        # Track current settings in memory; they hit disk on dropdown changes and
+        # on close rather than on every click.
         self.config['speed'] = speech_speed
         self.config['language'] = selected_lang_display
         self.config['speaker'] = selected_speaker_key
-        save_config(self.config)
 
-        # Disable buttons during generation
+        # Disable regenerate/replay during generation; Stop stays active so a
+        # long synthesis can be cancelled mid-stream.
         self.generate_button.config(state=tk.DISABLED, text="Generating...")
         self.play_button.config(state=tk.DISABLED)
-        self.stop_button.config(state=tk.DISABLED)
-        self.master.update_idletasks() # Update GUI immediately
+        self.stop_button.config(state=tk.NORMAL)
 
         try:
-            # 1. Get speaker embedding
-            speaker_embedding = self.kokoro_tts.get_speaker_data(selected_speaker_key)
-            speaker_embedding["name"] = selected_speaker_key # Add name for logging clarity
-
-            # 2. Generate audio
-            audio_data, sample_rate = self.kokoro_tts.generate_audio(input_text, speaker_embedding, speech_speed, selected_lang_display)
-
-            self.last_audio_data = audio_data
-            self.last_sample_rate = sample_rate
+            # 1. Get speaker style
+            speaker_voice = self.kokoro_tts.get_speaker_data(selected_speaker_key)
+        except Exception as e:
+            messagebox.showerror("Generation Error", f"An error occurred during audio generation: {e}")
+            logger.error(f"Error in generate_button_clicked: {e}")
+            self._reset_buttons()
+            return
 
-            # 3. Play audio
-            play_audio(audio_data, sample_rate)
-            self.stop_button.config(state=tk.NORMAL) # Enable stop button
+        # 2. Generate audio on the worker thread; ONNX inference releases the GIL,
+        # so the Tk event loop keeps pumping while it runs.
+        future = self._executor.submit(
+            self._generate_and_stream, input_text, speaker_voice, selected_speaker_key, speech_speed, self._lang_code
+        )
+        future.add_done_callback(lambda f: self.master.after(0, self._on_audio_ready, f))
+
+    def _generate_and_stream(self, input_text, speaker_voice, speaker_name, speech_speed, lang_code):
+        import sounddevice as sd
+
+        # Runs on the worker thread: plays each synthesized chunk as it arrives so
+        # playback starts after the first sentence rather than after the whole text.
+        # The shared playback stop event lets the Stop button cancel both the chunk
+        # writes and the remaining synthesis.
+        out_stream = None
+        # A replay may still be feeding _playback_stream; stop and join it
+        # before clearing the stop event, or the new generation would overlap it.
+        _interrupt_playback_writer()
+        _playback_stop.clear()
+
+        def on_chunk(samples, sample_rate):
+            nonlocal out_stream
+            if out_stream is None:
+                out_stream = sd.OutputStream(samplerate=sample_rate, channels=1, dtype='float32')
+                out_stream.start()
+            samples = samples.astype(np.float32, copy=False)
+            # Write in small blocks and poll the stop flag so Stop takes effect
+            # mid-sentence instead of after the current chunk drains.
+            for i in range(0, len(samples), _PLAYBACK_BLOCKSIZE):
+                if _playback_stop.is_set():
+                    return
+                out_stream.write(samples[i:i + _PLAYBACK_BLOCKSIZE])
 
-            # Enable play button
-            self.play_button.config(state=tk.NORMAL)
+        try:
+            return self.kokoro_tts.generate_audio_stream(
+                input_text, speaker_voice, speaker_name, speech_speed, lang_code,
+                on_chunk=on_chunk, stop_event=_playback_stop
+            )
+        finally:
+            if out_stream is not None:
+                out_stream.close()
 
+    def _on_audio_ready(self, future):
+        try:
+            audio_data, sample_rate = future.result()
         except Exception as e:
             messagebox.showerror("Generation Error", f"An error occurred during audio generation: {e}")
-            logger.error(f"Error in generate_and_play_audio: {e}")
-        finally:
-            self.generate_button.config(state=tk.NORMAL, text="Generate & Play Audio") # Re-enable button
+            logger.error(f"Error in generate_button_clicked: {e}")
+            self._reset_buttons()
+            return
+
+        # Playback already happened chunk-by-chunk; keep the full array for
+        # replay/save. A stop before the first chunk yields no audio to keep.
+        if audio_data is not None:
+            self.last_audio_data = audio_data
+            self.last_sample_rate = sample_rate
+        self._reset_buttons()
+
+    def _reset_buttons(self):
+        self.generate_button.config(state=tk.NORMAL, text="Generate & Play Audio")
+        self.play_button.config(state=tk.NORMAL if self.last_audio_data is not None else tk.DISABLED)
+        self.stop_button.config(state=tk.NORMAL)
 
     def play_last_audio(self):
         if self.last_audio_data is not None and self.last_sample_rate is not None:
@@ -248,7 +540,22 @@ class TTSApp:
         stop_audio()
 
     def save_button_clicked(self):
-        save_audio_to_wav(self.last_audio_data, self.last_sample_rate)
+        if self.last_audio_data is None:
+            messagebox.showinfo("No Audio", "No audio has been generated yet. Please generate audio first.")
+            return
+        file_path = filedialog.asksaveasfilename(
+            title="Save Audio As",
+            defaultextension=".wav",
+            filetypes=[("WAV files", "*.wav")]
+        )
+        if not file_path:
+            return
+        # The dialog runs on the Tk thread; the disk write goes to the worker so
+        # a large WAV doesn't block the UI.
+        future = self._executor.submit(save_audio_to_wav, self.last_audio_data, self.last_sample_rate, file_path)
+        future.add_done_callback(
+            lambda f: logger.error(f"Error saving audio to WAV: {f.exception()}") if f.exception() else None
+        )
 
     def on_closing(self):
         try:
@@ -259,6 +566,11 @@ class TTSApp:
             save_config(self.config)
         except ValueError:
             messagebox.showerror("Configuration Error", "Could not save configuration. Invalid speed value.")
+        # Cancel any in-flight generation/playback the same way the Stop button
+        # does; otherwise the worker keeps synthesizing (and playing) with no UI
+        # and the non-daemon executor thread blocks interpreter exit.
+        stop_audio()
+        self._executor.shutdown(wait=False)
         self.master.destroy()
 
 # --- Main Execution Block ---
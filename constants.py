@@ -1,18 +1,33 @@
 import os
+from types import MappingProxyType
 
 PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
 
 MODELS_DIR = os.path.join(PROJECT_DIR, "kokoro_models")
 MODEL_URL = "https://github.com/taylorchu/kokoro-onnx/releases/download/v0.2.0/kokoro.onnx"
-_MODEL_FILENAME = "kokoro_v1.onnx"
+# Pin the release digest here to verify downloads; None skips verification,
+# e.g. when MODEL_URL points at a different build.
+MODEL_SHA256 = None
 _VOICES_FILENAME = "voices_v1.bin"
 
-MODEL_PATH = os.path.join(MODELS_DIR, _MODEL_FILENAME)
+# Model precision variants: fp32 is the downloaded default, int8 is a dynamically
+# quantized copy generated locally when "precision": "int8" is set in gui_config.json.
+MODEL_FILENAMES = {
+    "fp32": "kokoro_v1.onnx",
+    "int8": "kokoro_v1.int8.onnx",
+}
+MODEL_PATHS = {precision: os.path.join(MODELS_DIR, name) for precision, name in MODEL_FILENAMES.items()}
+
+MODEL_PATH = MODEL_PATHS["fp32"]
 VOICES_PATH = os.path.join(MODELS_DIR, _VOICES_FILENAME)
+# Sidecar index mapping voice name -> (offset, shape) into the flat voice bank.
+# Absent on legacy installs whose voices file is still an .npz archive.
+VOICES_INDEX_PATH = os.path.join(MODELS_DIR, "voices_v1.index.json")
 
-SUPPORTED_LANGUAGES_DISPLAY = ["English", "English (British)","French", "Japanese", "Hindi", "Mandarin Chinese", "Spanish", "Brazilian Portuguese", "Italian"]
+SUPPORTED_LANGUAGES_DISPLAY = ("English", "English (British)","French", "Japanese", "Hindi", "Mandarin Chinese", "Spanish", "Brazilian Portuguese", "Italian")
 
-SUPPORTED_LANGUAGES = {
+# Read-only view so callers can't mutate the language table
+SUPPORTED_LANGUAGES = MappingProxyType({
     "English": "en-us",
     "English (British)": "en-gb",
     "French": "fr-fr",
@@ -22,9 +37,10 @@ SUPPORTED_LANGUAGES = {
     "Spanish": "es",
     "Brazilian Portuguese": "pt-br",
     "Italian": "it",
-}
+})
 
-SUPPORTED_VOICES =[
+# Ordered tuple for iteration/combobox values; frozenset for O(1) membership checks
+SUPPORTED_VOICES = (
     # American Female
     "af_heart", "af_alloy", "af_aoede", "af_bella", "af_jessica", "af_kore", "af_nicole", "af_nova", "af_river", "af_sarah", "af_sky",
     #American Male
@@ -44,4 +60,6 @@ SUPPORTED_VOICES =[
     "hf_alpha", "hf_beta", "hm_omega", "hm_psi",
     "if_sara", "im_nicola",
     "pf_dora", "pm_alex", "pm_santa",
-]
\ No newline at end of file
+)
+
+SUPPORTED_VOICES_SET = frozenset(SUPPORTED_VOICES)
\ No newline at end of file
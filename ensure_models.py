@@ -1,17 +1,41 @@
 
 import numpy as np
-import torch
+import hashlib
+import json
 import os
+import shutil
 import logging
 import requests
 from tqdm import tqdm
 import io
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 import constants
+import local_config
 
 # --- Configuration and Download Functions ---
 logger = logging.getLogger(__name__)
 
+# One shared session so all downloads reuse pooled TCP/TLS connections instead
+# of paying a fresh handshake per file, with retries for transient errors.
+_SESSION = requests.Session()
+_SESSION.mount("https://", requests.adapters.HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=requests.adapters.Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504]),
+))
+
+class _HashingWriter:
+    # Minimal file-like wrapper that feeds every written block through a hash,
+    # so shutil.copyfileobj can stream and verify in one pass.
+    def __init__(self, fileobj, digest):
+        self._fileobj = fileobj
+        self._digest = digest
+
+    def write(self, data):
+        self._digest.update(data)
+        return self._fileobj.write(data)
+
 def download_file():
     # Directory: kokoro_models
     modelsDir = constants.MODELS_DIR
@@ -28,18 +52,61 @@ def download_file():
         return
     
     print(f"Downloading {modelPath} from {modelUrl}...")
-    with requests.get(modelUrl, stream=True, allow_redirects=True) as response:
+    digest = hashlib.sha256() # Hashing the stream is near-free next to the writes
+    with _SESSION.get(modelUrl, stream=True, allow_redirects=True) as response:
         response.raise_for_status() # Raise an exception for bad status codes
         total_size = int(response.headers.get('content-length', 0))
-        block_size = 4096  # 4KB blocks
-        progress_bar = tqdm(total=total_size, unit='B', unit_scale=True, desc=modelPath)
-        with open(modelPath, 'wb') as file:
-            for data in response.iter_content(block_size):
-                progress_bar.update(len(data))
-                file.write(data)
-        progress_bar.close()
+        # copyfileobj with 1MB buffers instead of an iter_content loop keeps the
+        # Python-level iteration count (and progress updates) low for a ~300MB file
+        response.raw.decode_content = True
+        wrapped = tqdm.wrapattr(response.raw, 'read', total=total_size, desc=modelPath)
+        with wrapped, open(modelPath, 'wb') as file:
+            shutil.copyfileobj(wrapped, _HashingWriter(file, digest), length=1024 * 1024)
+
+    # A half-written or corrupted model otherwise only surfaces as a cryptic
+    # ONNX Runtime error at session init.
+    if constants.MODEL_SHA256 and digest.hexdigest() != constants.MODEL_SHA256:
+        os.remove(modelPath)
+        raise RuntimeError(
+            f"Downloaded model failed SHA-256 verification "
+            f"(got {digest.hexdigest()}, expected {constants.MODEL_SHA256})."
+        )
     print(f"Downloaded at {modelPath}")
 
+_VOICE_URL_PATTERN = "https://huggingface.co/hexgrad/Kokoro-82M/resolve/main/voices/{name}.pt"
+
+def _decode_voice(content):
+    # Take the plain .npy path only when the buffer carries the real .npy magic,
+    # so voice files published in numpy format skip torch entirely. The current
+    # .pt files are torch zip containers, which np.load would happily open as an
+    # NpzFile instead of raising, so an exception-based probe can't tell them apart.
+    magic = content.read(len(np.lib.format.MAGIC_PREFIX))
+    content.seek(0)
+    if magic == np.lib.format.MAGIC_PREFIX:
+        return np.load(content, allow_pickle=False)
+    else:
+        import torch  # Heavy import; only needed for the legacy .pt format
+        # Use map_location='cpu' to load to CPU, preventing potential CUDA errors
+        # if a GPU isn't available or configured for torch.
+        try:
+            # weights_only skips the general pickle machinery (and its module imports)
+            tensor = torch.load(content, map_location='cpu', weights_only=True)
+        except TypeError: # Older torch without the weights_only argument
+            content.seek(0)
+            tensor = torch.load(content, map_location='cpu')
+        # Copy out of the torch storage so the tensor can be freed right away
+        # instead of keeping the whole pickle buffer alive through the loop.
+        data = tensor.numpy().copy()
+        del tensor
+        return data
+
+def _fetch_voice(name):
+    url = _VOICE_URL_PATTERN.format(name=name)
+    r = _SESSION.get(url, timeout=30) # Don't let one stalled voice hang the pool
+    r.raise_for_status()  # Ensure the request was successful
+    data: np.ndarray = _decode_voice(io.BytesIO(r.content))
+    return data
+
 def download_voices_data():
     # Check if the voices file already exists
     if os.path.exists(constants.VOICES_PATH):
@@ -47,49 +114,118 @@ def download_voices_data():
         return
 
     names = constants.SUPPORTED_VOICES
-    pattern = "https://huggingface.co/hexgrad/Kokoro-82M/resolve/main/voices/{name}.pt"
-    voices = {}
+    index = {}
+    sample_count = 0
+    tmp_path = constants.VOICES_PATH + ".tmp"
 
-    for name in tqdm(names, desc="Downloading voices"):
-        url = pattern.format(name=name)
-        try:
-            r = requests.get(url)
-            r.raise_for_status()  # Ensure the request was successful
-            content = io.BytesIO(r.content)
-            # Use map_location='cpu' to load to CPU, preventing potential CUDA errors
-            # if a GPU isn't available or configured for torch.
-            data: np.ndarray = torch.load(content, map_location='cpu').numpy()
-            voices.update({name: data})
-        except Exception as e:
-            logger.warning(f"Failed to download voice '{name}' from {url}: {e}")
-            continue
-
-    if not voices:
+    # The downloads are latency-bound (60+ small files), so fetch them in parallel
+    # instead of paying one HTTP round trip at a time. Each voice is appended to a
+    # single flat float32 bank as soon as it arrives (peak memory stays at one
+    # voice), with a JSON index recording each voice's offset and shape so readers
+    # can memmap the bank and slice per-voice views in O(1).
+    try:
+        with open(tmp_path, "wb") as raw:
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                futures = {executor.submit(_fetch_voice, name): name for name in names}
+                for future in tqdm(as_completed(futures), total=len(futures), desc="Downloading voices"):
+                    name = futures[future]
+                    try:
+                        data = future.result()
+                    except Exception as e:
+                        logger.warning(f"Failed to download voice '{name}': {e}")
+                        continue
+                    data = np.ascontiguousarray(data, dtype=np.float32)
+                    raw.write(data.tobytes())
+                    index[name] = {"offset": sample_count, "shape": list(data.shape)}
+                    sample_count += data.size
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    if not index:
+        os.remove(tmp_path)
         raise RuntimeError("No voices were successfully downloaded. Cannot create voices file.")
 
+    # Wrap the raw samples in a valid single-array .npy so np.load (including
+    # kokoro_onnx's own loader) can still open the voices file; our readers
+    # memmap it and reshape slices via the index instead.
     with open(constants.VOICES_PATH, "wb") as f:
-        np.savez(f, **voices)
+        header = {
+            "descr": np.lib.format.dtype_to_descr(np.dtype(np.float32)),
+            "fortran_order": False,
+            "shape": (sample_count,),
+        }
+        np.lib.format.write_array_header_1_0(f, header)
+        with open(tmp_path, "rb") as raw:
+            shutil.copyfileobj(raw, f, length=1024 * 1024)
+    os.remove(tmp_path)
+
+    with open(constants.VOICES_INDEX_PATH, "w") as f:
+        json.dump(index, f)
     print(f"Created {constants.VOICES_PATH}")
 
+def active_precision():
+    # "precision" in gui_config.json selects the model variant; fp32 is the default.
+    precision = local_config.load_config().get("precision", "fp32")
+    if precision not in constants.MODEL_PATHS:
+        logger.warning(f"Unknown model precision '{precision}', falling back to fp32.")
+        precision = "fp32"
+    return precision
+
+def active_model_path():
+    precision = active_precision()
+    path = constants.MODEL_PATHS[precision]
+    # If the requested variant couldn't be produced (e.g. quantization tooling
+    # missing), run on fp32 rather than failing at session init.
+    if precision != "fp32" and not os.path.exists(path):
+        logger.warning(f"'{path}' is not available, falling back to the fp32 model.")
+        return constants.MODEL_PATHS["fp32"]
+    return path
+
+def ensure_quantized_model():
+    # Generate the int8 variant locally from the downloaded fp32 model the first
+    # time the user opts in. Dynamic quantization roughly halves MatMul bytes on CPU.
+    int8_path = constants.MODEL_PATHS["int8"]
+    if os.path.exists(int8_path):
+        return
+    try:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+    except ImportError as e:
+        # The quantization tools need the onnx package at runtime
+        logger.warning(f"Cannot quantize the model ({e}); install 'onnx' to use int8. Using fp32.")
+        return
+    print(f"Quantizing {constants.MODEL_PATH} to int8 at {int8_path}...")
+    # Quantize to a tmp file and os.replace on success, so a crash mid-quantization
+    # can't leave a partial int8 model that the exists() check above would treat as
+    # done and session init would then choke on.
+    tmp_path = int8_path + ".tmp"
+    try:
+        quantize_dynamic(constants.MODEL_PATH, tmp_path, weight_type=QuantType.QInt8)
+    except Exception as e:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        logger.warning(f"Quantization failed ({e}); using fp32.")
+        return
+    os.replace(tmp_path, int8_path)
+    print(f"Created {int8_path}")
+
 def ensure_kokoro_assets_exist():
     download_file()
     download_voices_data()
+    if active_precision() == "int8":
+        ensure_quantized_model()
 
 
 def generate_timestamp_filename(prefix: str = "synthesized_audio", extension: str = ".wav") -> str:
-    # %I for 12-hour clock, %p for AM/PM, %d for day, %B for full month name
-    timestamp = datetime.now().strftime("%I%p %dth %B").lower() # .lower() to make "pm" lowercase
-    # Remove leading zero for hours if present and handle 'st', 'nd', 'rd', 'th' for day
-    if timestamp[0] == '0':
-        timestamp = timestamp[1:]
-
-    day_str = datetime.now().day
-    if 10 < day_str < 20: # Handles 11th, 12th, 13th, etc.
+    # e.g. "synthesized_audio - 4pm 21st august.wav"
+    now = datetime.now()
+    hour = now.strftime("%I").lstrip("0") or "12"
+    am_pm = now.strftime("%p").lower()
+    day = now.day
+    if 10 < day < 20: # Handles 11th, 12th, 13th, etc.
         day_suffix = "th"
     else:
-        day_suffix = {1: "st", 2: "nd", 3: "rd"}.get(day_str % 10, "th")
-
-    # Replace the default 'th' with the correct suffix
-    timestamp = timestamp.replace("th", day_suffix, 1) # Only replace the first 'th'
-
-    return f"{prefix} - {timestamp}{extension}"
\ No newline at end of file
+        day_suffix = {1: "st", 2: "nd", 3: "rd"}.get(day % 10, "th")
+    month = now.strftime("%B").lower()
+    return f"{prefix} - {hour}{am_pm} {day}{day_suffix} {month}{extension}"
\ No newline at end of file
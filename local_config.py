@@ -8,15 +8,28 @@ DEFAULT_LANGUAGE_DISPLAY = "English" # Use the display name
 CONFIG_FILE = os.path.join(constants.MODELS_DIR, "gui_config.json") # File for persistent settings
 
 # --- Configuration Persistence Functions ---
+_last_saved = None # Serialized form of what is on disk, to skip redundant writes
+
 def load_config():
+    global _last_saved
     if os.path.exists(CONFIG_FILE):
         with open(CONFIG_FILE, 'r') as f:
             try:
-                return json.load(f)
+                config = json.load(f)
             except json.JSONDecodeError:
                 return {}
+        _last_saved = json.dumps(config, sort_keys=True)
+        return config
     return {}
 
 def save_config(config):
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump(config, f, indent=4)
\ No newline at end of file
+    global _last_saved
+    serialized = json.dumps(config, sort_keys=True)
+    if serialized == _last_saved:
+        return # Nothing changed since the last write
+    # Write to a tmp file and os.replace so a crash can't leave a half-written config
+    tmp_file = CONFIG_FILE + ".tmp"
+    with open(tmp_file, 'w') as f:
+        json.dump(config, f, indent=4)
+    os.replace(tmp_file, CONFIG_FILE)
+    _last_saved = serialized
\ No newline at end of file